@@ -9,8 +9,11 @@ import {
   impersonatingFromId,
   runs,
   programs,
+  SESSION_DURATION_MS,
 } from './mock-store';
 
+const IMPERSONATION_DURATION_MS = 3600000;
+
 export interface AdminUserStats {
   totalUsers: number;
   activeUsers: number;
@@ -106,14 +109,35 @@ export interface ImpersonationStatus {
   targetUserRole?: string;
 }
 
-function toAdminUser(u: any): AdminUser {
-  const userRuns = Array.from(runs.values()).filter((r) => r.ownerId === u.id);
-  const userProgs = Array.from(programs.values()).filter((p) => p.owner === u.id);
+interface OwnerIndex {
+  runs: Map<string, number>;
+  programs: Map<string, number>;
+}
+
+function countByOwner<T>(items: Iterable<T>, ownerOf: (item: T) => string): Map<string, number> {
+  const counts = new Map<string, number>();
+  for (const item of items) {
+    const owner = ownerOf(item);
+    counts.set(owner, (counts.get(owner) ?? 0) + 1);
+  }
+  return counts;
+}
+
+// Build per-owner run/program counts in one pass so listing N users does not
+// rescan every run and program once per user.
+function buildOwnerIndex(): OwnerIndex {
+  return {
+    runs: countByOwner(runs.values(), (r) => r.ownerId),
+    programs: countByOwner(programs.values(), (p) => p.owner),
+  };
+}
+
+function toAdminUser(u: any, index: OwnerIndex = buildOwnerIndex()): AdminUser {
   return {
     ...u,
     usageStats: {
-      totalRuns: userRuns.length,
-      totalPrograms: userProgs.length,
+      totalRuns: index.runs.get(u.id) ?? 0,
+      totalPrograms: index.programs.get(u.id) ?? 0,
       storageUsedMB: Math.floor(Math.random() * 500),
     },
   };
@@ -122,18 +146,20 @@ function toAdminUser(u: any): AdminUser {
 export const adminApi = {
   getUserStats: async (): Promise<AdminUserStats> => {
     await delay();
-    const all = Array.from(users.values());
-    return {
-      totalUsers: all.length,
-      activeUsers: all.filter((u) => u.status === 'active').length,
-      suspendedUsers: all.filter((u) => u.status === 'suspended').length,
-      pendingUsers: all.filter((u) => u.status === 'pending').length,
-      usersByRole: {
-        admin: all.filter((u) => u.role === 'admin').length,
-        developer: all.filter((u) => u.role === 'developer').length,
-        end_user: all.filter((u) => u.role === 'end_user').length,
-      },
+    const stats: AdminUserStats = {
+      totalUsers: users.size,
+      activeUsers: 0,
+      suspendedUsers: 0,
+      pendingUsers: 0,
+      usersByRole: { admin: 0, developer: 0, end_user: 0 },
     };
+    for (const u of users.values()) {
+      if (u.status === 'active') stats.activeUsers++;
+      else if (u.status === 'suspended') stats.suspendedUsers++;
+      else if (u.status === 'pending') stats.pendingUsers++;
+      stats.usersByRole[u.role]++;
+    }
+    return stats;
   },
 
   listUsers: async (params: AdminUserListParams = {}): Promise<AdminUserListResponse> => {
@@ -156,9 +182,10 @@ export const adminApi = {
     const totalPages = Math.ceil(total / limit);
     const start = (page - 1) * limit;
     const paged = all.slice(start, start + limit);
+    const index = buildOwnerIndex();
 
     return {
-      users: paged.map(toAdminUser),
+      users: paged.map((u) => toAdminUser(u, index)),
       total,
       page,
       limit,
@@ -261,7 +288,7 @@ export const adminApi = {
 
     return {
       token,
-      expiresAt: new Date(Date.now() + 3600000).toISOString(),
+      expiresAt: new Date(Date.now() + IMPERSONATION_DURATION_MS).toISOString(),
       targetUserId: target.id,
       targetUserEmail: target.email,
       targetUserName: target.displayName,
@@ -283,7 +310,7 @@ export const adminApi = {
 
     return {
       token,
-      expiresAt: new Date(Date.now() + 86400000).toISOString(),
+      expiresAt: new Date(Date.now() + SESSION_DURATION_MS).toISOString(),
       message: 'Impersonation stopped',
     };
   },
@@ -9,6 +9,8 @@ import {
   getUserByEmail,
   setCurrentUserId,
   getCurrentUser,
+  SESSION_DURATION_HOURS,
+  SESSION_DURATION_MS,
 } from './mock-store';
 
 const FAKE_TOKEN = 'mock-jwt-token-mellea';
@@ -20,7 +22,7 @@ export const authApi = {
       mode: 'local',
       providers: ['local'],
       registrationEnabled: true,
-      sessionDurationHours: 24,
+      sessionDurationHours: SESSION_DURATION_HOURS,
     };
   },
 
@@ -40,7 +42,7 @@ export const authApi = {
     user.lastLoginAt = now();
     return {
       token,
-      expiresAt: new Date(Date.now() + 86400000).toISOString(),
+      expiresAt: new Date(Date.now() + SESSION_DURATION_MS).toISOString(),
       user,
     };
   },
@@ -68,7 +70,7 @@ export const authApi = {
     setCurrentUserId(id);
     return {
       token,
-      expiresAt: new Date(Date.now() + 86400000).toISOString(),
+      expiresAt: new Date(Date.now() + SESSION_DURATION_MS).toISOString(),
       user: newUser,
     };
   },
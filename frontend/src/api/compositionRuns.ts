@@ -9,6 +9,7 @@ import {
   simulateCompositionRunExecution,
   runLogs,
 } from './mock-store';
+import { isTerminalStatus } from './runs';
 
 // =============================================================================
 // Types
@@ -166,13 +167,17 @@ export const compositionRunsApi = {
     const run = compositionRuns.get(id);
     if (!run) throw { response: { status: 404, data: { detail: 'Composition run not found' } } };
     const states = Object.values(run.nodeStates);
+    const counts: Record<NodeExecutionStatus, number> = {
+      pending: 0,
+      running: 0,
+      succeeded: 0,
+      failed: 0,
+      skipped: 0,
+    };
+    for (const state of states) counts[state.status]++;
     return {
       total: states.length,
-      pending: states.filter((s) => s.status === 'pending').length,
-      running: states.filter((s) => s.status === 'running').length,
-      succeeded: states.filter((s) => s.status === 'succeeded').length,
-      failed: states.filter((s) => s.status === 'failed').length,
-      skipped: states.filter((s) => s.status === 'skipped').length,
+      ...counts,
       currentNodeId: run.currentNodeId,
       nodeStates: run.nodeStates,
     };
@@ -278,7 +283,7 @@ export const compositionRunsApi = {
       const progress = await compositionRunsApi.getProgress(id);
       onProgress(progress);
 
-      if (['succeeded', 'failed', 'cancelled'].includes(run.status)) {
+      if (isTerminalStatus(run.status)) {
         return run;
       }
       await new Promise((resolve) => setTimeout(resolve, intervalMs));
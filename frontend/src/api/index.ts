@@ -10,7 +10,7 @@ export { githubImportApi } from './github-import';
 export { modelsApi } from './models';
 export { notificationsApi } from './notifications';
 export { programsApi } from './programs';
-export { runsApi } from './runs';
+export { runsApi, isTerminalStatus } from './runs';
 
 // Re-export types from compositionRuns
 export type {
@@ -36,6 +36,9 @@ export function delay(ms: number = 80): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
+export const SESSION_DURATION_HOURS = 24;
+export const SESSION_DURATION_MS = SESSION_DURATION_HOURS * 3600000;
+
 // =============================================================================
 // Password store (email -> password)
 // =============================================================================
@@ -472,9 +475,10 @@ export function simulateRunExecution(runId: string): void {
   setTimeout(() => {
     const r = runs.get(runId);
     if (!r || r.status === 'cancelled') return;
+    const ts = now();
     r.status = 'starting';
-    r.startedAt = now();
-    logs.push(`[${new Date().toISOString()}] Starting program...`);
+    r.startedAt = ts;
+    logs.push(`[${ts}] Starting program...`);
   }, 1000);
 
   // starting -> running after 2s
@@ -482,7 +486,7 @@ export function simulateRunExecution(runId: string): void {
     const r = runs.get(runId);
     if (!r || r.status === 'cancelled') return;
     r.status = 'running';
-    logs.push(`[${new Date().toISOString()}] Runtime environment ready.`);
+    logs.push(`[${now()}] Runtime environment ready.`);
   }, 2000);
 
   // Emit log lines every 400ms from 2.5s to ~7.5s
@@ -490,7 +494,7 @@ export function simulateRunExecution(runId: string): void {
     setTimeout(() => {
       const r = runs.get(runId);
       if (!r || r.status === 'cancelled') return;
-      logs.push(`[${new Date().toISOString()}] ${line}`);
+      logs.push(`[${now()}] ${line}`);
     }, 2500 + i * 400);
   });
 
@@ -498,8 +502,9 @@ export function simulateRunExecution(runId: string): void {
   setTimeout(() => {
     const r = runs.get(runId);
     if (!r || r.status === 'cancelled') return;
+    const ts = now();
     r.status = 'succeeded';
-    r.completedAt = now();
+    r.completedAt = ts;
     r.exitCode = 0;
     r.output = 'Program output:\nHello from Mellea!\nExecution complete.\n';
     r.metrics = {
@@ -508,7 +513,7 @@ export function simulateRunExecution(runId: string): void {
       executionDurationMs: 6000,
       totalDurationMs: 8000,
     };
-    logs.push(`[${new Date().toISOString()}] Run completed successfully.`);
+    logs.push(`[${ts}] Run completed successfully.`);
   }, 8000);
 }
 
@@ -524,9 +529,10 @@ export function simulateCompositionRunExecution(runId: string): void {
   setTimeout(() => {
     const r = compositionRuns.get(runId);
     if (!r || r.status === 'cancelled') return;
+    const ts = now();
     r.status = 'starting';
-    r.startedAt = now();
-    logs.push(`[${new Date().toISOString()}] Starting composition...`);
+    r.startedAt = ts;
+    logs.push(`[${ts}] Starting composition...`);
   }, 500);
 
   // starting -> running
@@ -543,31 +549,33 @@ export function simulateCompositionRunExecution(runId: string): void {
     setTimeout(() => {
       const r = compositionRuns.get(runId);
       if (!r || r.status === 'cancelled') return;
+      const ts = now();
       r.currentNodeId = nodeId;
       const ns: NodeExecutionState = {
         nodeId,
         status: 'running',
-        startedAt: now(),
+        startedAt: ts,
         completedAt: null,
         output: null,
         errorMessage: null,
         logs: [`Executing node ${nodeId}...`],
       };
       r.nodeStates[nodeId] = ns;
-      logs.push(`[${new Date().toISOString()}] Node ${nodeId}: running`);
+      logs.push(`[${ts}] Node ${nodeId}: running`);
     }, startMs);
 
     setTimeout(() => {
       const r = compositionRuns.get(runId);
       if (!r || r.status === 'cancelled') return;
+      const ts = now();
       const ns = r.nodeStates[nodeId];
       if (ns) {
         ns.status = 'succeeded';
-        ns.completedAt = now();
+        ns.completedAt = ts;
         ns.output = `Result from node ${nodeId}`;
         ns.logs.push('Done.');
       }
-      logs.push(`[${new Date().toISOString()}] Node ${nodeId}: succeeded`);
+      logs.push(`[${ts}] Node ${nodeId}: succeeded`);
     }, startMs + 1200);
   });
 
@@ -576,9 +584,10 @@ export function simulateCompositionRunExecution(runId: string): void {
   setTimeout(() => {
     const r = compositionRuns.get(runId);
     if (!r || r.status === 'cancelled') return;
+    const ts = now();
     r.status = 'succeeded';
-    r.completedAt = now();
+    r.completedAt = ts;
     r.currentNodeId = null;
-    logs.push(`[${new Date().toISOString()}] Composition completed successfully.`);
+    logs.push(`[${ts}] Composition completed successfully.`);
   }, totalMs);
 }
@@ -19,6 +19,16 @@ interface SharedUserResponse {
   permission: Permission;
 }
 
+const TERMINAL_STATUSES: ReadonlySet<string> = new Set<RunExecutionStatus>([
+  'succeeded',
+  'failed',
+  'cancelled',
+]);
+
+export function isTerminalStatus(status: string): boolean {
+  return TERMINAL_STATUSES.has(status);
+}
+
 export const runsApi = {
   create: async (data: CreateRunRequest): Promise<Run> => {
     await delay(150);
@@ -108,7 +118,7 @@ export const runsApi = {
     let failedCount = 0;
     for (const rid of runIds) {
       const run = runs.get(rid);
-      if (run && ['succeeded', 'failed', 'cancelled'].includes(run.status)) {
+      if (run && isTerminalStatus(run.status)) {
         runs.delete(rid);
         results[rid] = true;
         deletedCount++;
@@ -15,6 +15,7 @@ import {
   type NodeExecutionStatus,
   type ResumeRunResponse,
 } from '@/api/compositionRuns';
+import { isTerminalStatus } from '@/api/runs';
 import { type NodeExecutionState as CanvasNodeExecutionState } from '@/components/Builder/theme';
 
 // Map backend node status to canvas execution state
@@ -165,7 +166,7 @@ export function useCompositionExecution(
           onProgress?.(progress);
 
           // Check if run is complete
-          if (['succeeded', 'failed', 'cancelled'].includes(run.status)) {
+          if (isTerminalStatus(run.status)) {
             pollingRef.current = false;
             setState((prev) => ({
               ...prev,
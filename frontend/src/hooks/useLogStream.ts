@@ -1,6 +1,7 @@
 import { useState, useEffect, useCallback, useRef } from 'react';
 import { isAuthenticated } from '@/api/client';
 import { runLogs, runs } from '@/api/mock-store';
+import { isTerminalStatus } from '@/api/runs';
 
 export type LogStreamStatus = 'idle' | 'connecting' | 'connected' | 'completed' | 'error';
 
@@ -72,7 +73,7 @@ export function useLogStream(
       }
 
       // Check if the run has reached a terminal state
-      if (run && ['succeeded', 'failed', 'cancelled'].includes(run.status)) {
+      if (run && isTerminalStatus(run.status)) {
         // Give a moment for the last logs to arrive
         setTimeout(() => {
           // Grab any final log lines
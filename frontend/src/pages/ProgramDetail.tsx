@@ -36,14 +36,9 @@ import {
   Tooltip,
 } from '@chakra-ui/react';
 import { FiArrowLeft, FiPlay, FiClock, FiTrash2, FiRefreshCw } from 'react-icons/fi';
-
-// Helper to check if a run can be deleted (must be in terminal state)
-function isTerminalStatus(status: string): boolean {
-  return status === 'succeeded' || status === 'failed' || status === 'cancelled';
-}
 import { CodeViewer, DependenciesEditor } from '@/components/Programs';
 import { RunPanel, RunStatusBadge, LogViewer } from '@/components/Runs';
-import { programsApi, runsApi } from '@/api';
+import { programsApi, runsApi, isTerminalStatus } from '@/api';
 import type { ProgramAsset, Run, ProgramDependencies } from '@/types';
 
 function formatDate(dateString?: string): string {
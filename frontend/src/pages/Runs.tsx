@@ -36,7 +36,7 @@ import {
 } from '@chakra-ui/react';
 import { FiClock, FiSearch, FiTrash2, FiChevronDown, FiChevronRight, FiExternalLink, FiRefreshCw } from 'react-icons/fi';
 import { RunStatusBadge, RunPanel, RunVisibilitySelector } from '@/components/Runs';
-import { runsApi, programsApi } from '@/api';
+import { runsApi, programsApi, isTerminalStatus } from '@/api';
 import { useAuth } from '@/hooks/useAuth';
 import type { Run, ProgramAsset, RunExecutionStatus, SharingMode } from '@/types';
 
@@ -51,10 +51,6 @@ function formatDuration(ms?: number): string {
   return `${(ms / 1000).toFixed(1)}s`;
 }
 
-function isTerminalStatus(status: string): boolean {
-  return status === 'succeeded' || status === 'failed' || status === 'cancelled';
-}
-
 interface RunFilters {
   status: RunExecutionStatus | 'all';
   programId: string;
@@ -420,7 +420,7 @@ export type AssetType = 'program' | 'model' | 'composition';
 
 // Sharing types
 export type Permission = 'view' | 'run' | 'edit';
-export type ResourceType = 'program' | 'model' | 'composition';
+export type ResourceType = AssetType;
 export type AccessType = 'user' | 'group' | 'org';
 
 export interface ShareLink {